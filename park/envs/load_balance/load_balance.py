@@ -73,10 +73,16 @@ class LoadBalanceEnv(core.Env):
         self.incoming_job = None
         # finished jobs (for logging at the end)
         self.finished_jobs = []
+        # total size of jobs scheduled to servers
+        self._scheduled_total_size = 0.0
+        # time at which all scheduled jobs would be completed
+        self._makespan = 0.0
         # time stamp of last event
         self.last_time = 0
         # servers
         self.servers = self.initialize_servers(service_rates)
+        # time at which each server would finish all jobs scheduled to it
+        self._server_load = np.zeros(len(self.servers))
         # observation and action space
         self.setup_space()
         # reset environment (generate new jobs)
@@ -119,7 +125,7 @@ class LoadBalanceEnv(core.Env):
         # load on each server
         for server in self.servers:
             # queuing work
-            load = sum(j.size for j in server.queue)
+            load = server._queued_size
             if server.curr_job is not None:
                 # remaining work currently being processed
                 load += server.curr_job.finish_time - self.wall_time.curr_time
@@ -148,6 +154,9 @@ class LoadBalanceEnv(core.Env):
         assert self.num_stream_jobs_left > 0
         self.incoming_job = None
         self.finished_jobs = []
+        self._server_load = np.zeros(len(self.servers))
+        self._scheduled_total_size = 0.0
+        self._makespan = 0.0
         # initialize environment (jump to first job arrival event)
         self.initialize()
         return self.observe()
@@ -179,6 +188,15 @@ class LoadBalanceEnv(core.Env):
         # reward = self.reward_calculator.get_reward(action)
         reward = 0
 
+        # jobs are processed back to back, so the server finishes the
+        # incoming job one duration after it drains its current work
+        duration = int(self.incoming_job.size /
+                       self.servers[action].service_rate)
+        self._server_load[action] = max(
+            self._server_load[action], self.wall_time.curr_time) + duration
+        self._makespan = max(self._makespan, self._server_load[action])
+        self._scheduled_total_size += self.incoming_job.size
+
         # schedule job to server
         self.servers[action].schedule(self.incoming_job)
 
@@ -1,5 +1,4 @@
 from abc import ABC
-from functools import reduce
 
 OBJECTIVE_NAMES = ['makespan', 'waitingTime', 'completionTime']
 
@@ -10,6 +9,8 @@ class BaseRewardCalculator(ABC):
         :param env: LoadBalanceEnv's instance
     """
 
+    __slots__ = ('env',)
+
     def __init__(self, env):
         self.env = env
 
@@ -28,11 +29,22 @@ class WaitingTimeReward(BaseRewardCalculator):
             before it can execute
     """
 
-    def get_reward(self, action):
-        # compute waiting time for processing job
-        waitTime = self.env.observe()[action]
+    __slots__ = ()
+
+    def _compute_wait(self, server, now):
+        # remaining time of the job currently being processed (if any)
+        curr_job = server.curr_job
+        wait_curr_job = 0.0
+        if curr_job is not None:
+            wait_curr_job = max(0.0, curr_job.finish_time - now)
 
-        return -1.0 * waitTime
+        # plus time to process all jobs queued in front of the incoming job
+        return wait_curr_job + server._queued_work_time
+
+    def get_reward(self, action):
+        env = self.env
+        return -1.0 * self._compute_wait(env.servers[action],
+                                         env.wall_time.curr_time)
 
 
 class CompletionTimeReward(WaitingTimeReward):
@@ -42,51 +54,43 @@ class CompletionTimeReward(WaitingTimeReward):
             that job (i.e. waiting time + processing time on that server)
     """
 
-    def get_reward(self, action):
-        wait_time = - super().get_reward(action)
-        complete_time = wait_time + self.env.incoming_job.size / \
-            self.env.servers[action].service_rate
+    __slots__ = ()
 
-        return -1.0 * complete_time
+    def get_reward(self, action):
+        env = self.env
+        server = env.servers[action]
+        now = env.wall_time.curr_time
+        inv_rate = server._inv_service_rate
+        return -1.0 * (self._compute_wait(server, now) +
+                       env.incoming_job.size * inv_rate)
 
 
 class MakespanReward(BaseRewardCalculator):
     """
         Directly optimize the makespan of all jobs arrival to the cluster
-        IMPORTANT: Extremely sparse reward, only return makespan after finishing all jobs 
+        The makespan is given as a difference reward: each action is rewarded with the\
+            increase of the makespan it causes (negated), so the rewards of an episode\
+            sum up to the negative makespan of all jobs
     """
 
-    def get_reward(self, action):
-        # TODO: The reward seem to be faulty because in the last state \
-        # though a smaller makespan has higher reward than the longer one \
-        # the final reward is smaller than default scarsity reward (i.e. 0)
-        if self.env.num_stream_jobs_left == 0:
-            # this is the last job arrival event
-            # thus, we have to compute the time we would complete all job
-            state = self.env.observe()
-            server_load, job_size = state[:-1], state[-1]
-
-            # load of queued jobs of each server
-            queue_load = [sum([job.size for job in server.queue])
-                          for server in self.env.servers]
-
-            # server load in total
-            server_load = [cur + wait for cur,
-                           wait in zip(server_load, queue_load)]
-
-            job_duration = job_size / self.env.servers[action].service_rate
-
-            # server load after taking given action
-            server_load[action] = server_load[action] + job_duration
+    __slots__ = ()
 
-            print(server_load)
+    def get_makespan(self, action):
+        """
+            :param action: int - index of assigned server
+            :return: makespan of all scheduled jobs after assigning the incoming job
+        """
+        env = self.env
+        server = env.servers[action]
+        now = env.wall_time.curr_time
+        # same duration as the job would take in Server.process
+        job_duration = int(env.incoming_job.size / server.service_rate)
+        finish_time = max(env._server_load[action], now) + job_duration
 
-            # completion time of all jobs
-            finish_time = max(server_load) + self.env.wall_time.curr_time
+        return max(env._makespan, finish_time)
 
-            return -1.0 * finish_time
-        else:
-            return 0
+    def get_reward(self, action):
+        return self.env._makespan - self.get_makespan(action)
 
 
 class NormalizedMakespanReward(MakespanReward):
@@ -96,34 +100,46 @@ class NormalizedMakespanReward(MakespanReward):
 
         This reward can be consider as the parallelism of scheduling (highest reward 
             being equal to num_servers if all servers have service rate of 1.0)
+
+        Given as a difference reward: each action is rewarded with the change of\
+            (total size of scheduled jobs) / makespan, which sums up to the final reward
     """
 
+    __slots__ = ()
+
     def get_reward(self, action):
-        reward = super().get_reward(action)
-        if reward != 0:
-            norm = reduce(lambda acc, elem: acc + elem,
-                          [job.size for job in self.env.finished_jobs],
-                          0)
-            return - 1.0 * norm / reward
-        else:
-            return reward
+        env = self.env
+        prev_makespan = env._makespan
+        prev_work = env._scheduled_total_size
+        prev_parallelism = prev_work / prev_makespan if prev_makespan > 0 else 0
+
+        makespan = self.get_makespan(action)
+        work = prev_work + env.incoming_job.size
+        parallelism = work / makespan if makespan > 0 else 0
+
+        return parallelism - prev_parallelism
+
+
+_CALCULATORS = {
+    'makespan': NormalizedMakespanReward,
+    'waitingTime': WaitingTimeReward,
+    'completionTime': CompletionTimeReward,
+}
 
 
 class RewardCalculator:
     """
         Wrapper of reward calculator
+        get_reward is bound directly to the selected calculator's get_reward
     """
 
+    __slots__ = ('reward_calculator', 'get_reward')
+
     def __init__(self, objective, env):
-        if not objective in OBJECTIVE_NAMES:
+        try:
+            calculator_cls = _CALCULATORS[objective]
+        except KeyError:
             raise ValueError("Expect objective name to be one of " + str(OBJECTIVE_NAMES) +
                              "but got: " + str(objective))
-        if objective == 'makespan':
-            self.reward_calculator = NormalizedMakespanReward(env)
-        elif objective == 'waitingTime':
-            self.reward_calculator = WaitingTimeReward(env)
-        elif objective == 'completionTime':
-            self.reward_calculator = CompletionTimeReward(env)
-
-    def get_reward(self, act):
-        return self.reward_calculator.get_reward(act)
+        self.reward_calculator = calculator_cls(env)
+        self.get_reward = self.reward_calculator.get_reward
@@ -5,12 +5,19 @@ class Server(object):
     def __init__(self, server_id, service_rate, wall_time):
         self.server_id = server_id
         self.service_rate = service_rate
+        self._inv_service_rate = 1.0 / service_rate
         self.wall_time = wall_time
         self.queue = deque()
+        # total size and time to process all queued jobs,
+        # kept in step with self.queue
+        self._queued_size = 0
+        self._queued_work_time = 0.0
         self.curr_job = None
 
     def schedule(self, job):
         self.queue.append(job)
+        self._queued_size += job.size
+        self._queued_work_time += job.size * self._inv_service_rate
         job.server = self
 
     def process(self):
@@ -22,6 +29,13 @@ class Server(object):
            and len(self.queue) > 0:
 
             self.curr_job = self.queue.popleft()
+            self._queued_size -= self.curr_job.size
+            if len(self.queue) > 0:
+                self._queued_work_time -= \
+                    self.curr_job.size * self._inv_service_rate
+            else:
+                # avoid accumulating floating point error
+                self._queued_work_time = 0.0
             duration = int(self.curr_job.size / self.service_rate)
             self.curr_job.start_time = self.wall_time.curr_time
             self.curr_job.finish_time = self.wall_time.curr_time + duration
@@ -33,4 +47,6 @@ class Server(object):
 
     def reset(self):
         self.queue = deque()
+        self._queued_size = 0
+        self._queued_work_time = 0.0
         self.curr_job = None